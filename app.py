@@ -7,9 +7,7 @@ import time
 import tempfile
 import random
 import json
-
-ASCII_CHARS = "░@B%8&WM#*oahkbdpqwmZO0QLCJUYXzcvunxrjft/|()1{}[]?-_+~<>i!lI;:,^`'. "
-ASCII_CHARS = ASCII_CHARS[::-1]  # Invert for better visual result
+from tiles import ASCII_CHARS, COLORS, TiledRenderer, to_ascii, render_ascii, draw_ascii
 
 MORSE_CODE_DICT = {
     'A': '.-', 'B': '-...', 'C': '-.-.', 'D': '-..', 'E': '.', 'F': '..-.', 'G': '--.', 'H': '....',
@@ -20,10 +18,6 @@ MORSE_CODE_DICT = {
     '8': '---..', '9': '----.', '0': '-----'
 }
 
-COLORS = {
-    '#': (245, 5, 183),
-}
-
 def text_to_morse(text):
     text = text.upper()
     morse_text = ' '.join([MORSE_CODE_DICT.get(char, char) for char in text])
@@ -35,16 +29,6 @@ def grayscale(image):
 def resize(image, new_width, new_height):
     return cv2.resize(image, (new_width, new_height))
 
-def to_ascii(image):
-    pixels = image.flatten()
-    num_chars = len(ASCII_CHARS)
-    scale = 256 // num_chars if num_chars else 1
-    ascii_str = "".join([ASCII_CHARS[min(pixel // scale, num_chars - 1)] for pixel in pixels])
-    return ascii_str
-
-def render_ascii(ascii_image, width):
-    return [ascii_image[i:i + width] for i in range(0, len(ascii_image), width)]
-
 def get_video_files(directory):
     video_extensions = ['mp4', 'avi', 'mov', 'mkv']
     files = [os.path.join(directory, f) for f in os.listdir(directory) if f.split('.')[-1] in video_extensions]
@@ -66,7 +50,9 @@ def get_prefs(file_path):
             "screen_size": (1920, 1080),
             "stream_video_directory": "stream",
             "title": True,
-            "progress_bar": True
+            "progress_bar": True,
+            "tile_workers": 1,
+            "tile_backend": "process"
             }
         json_object = json.dumps(default_prefs, indent=4)
         with open(file_path, "w") as outfile:
@@ -89,6 +75,12 @@ screen = pygame.display.set_mode((screen_width, screen_height), pygame.NOFRAME)
 pygame.display.set_caption('ASCII Video Renderer')
 font = pygame.font.SysFont('Courier', 12)
 
+# Split the frame grid into bands on a worker pool, for very large screens
+tile_workers = prefs.get('tile_workers', 1)
+tiler = None
+if tile_workers > 1:
+    tiler = TiledRenderer('Courier', 12, ASCII_CHARS, COLORS, tile_workers, prefs.get('tile_backend', 'process'))
+
 video_directory = prefs['stream_video_directory']
 
 if not os.path.exists(video_directory):
@@ -177,8 +169,11 @@ def play_video():
 
             frame = resize(frame, new_width=new_width, new_height=new_height)
 
-            ascii_image = to_ascii(frame)
-            ascii_image_lines = render_ascii(ascii_image, new_width)
+            if tiler is not None:
+                ascii_image_lines = tiler.convert(frame)
+            else:
+                ascii_image = to_ascii(frame)
+                ascii_image_lines = render_ascii(ascii_image, new_width)
 
             screen.fill((0, 0, 0))
 
@@ -186,11 +181,10 @@ def play_video():
                 title_surface = font.render(video_title_morse, True, (245, 5, 183))
                 screen.blit(title_surface, (0, 0))
 
-                for i, line in enumerate(ascii_image_lines):
-                    for j, char in enumerate(line):
-                        color = COLORS.get(char, (255, 255, 255))
-                        text_surface = font.render(char, True, color)
-                        screen.blit(text_surface, (j * char_width, (i + 1) * char_height))
+                if tiler is not None:
+                    tiler.draw(screen, ascii_image_lines, (0, char_height))
+                else:
+                    draw_ascii(screen, font, ascii_image_lines, (0, char_height))
 
             if(prefs['progress_bar'] == True):
                 progress = min(int((elapsed_time / video_duration) * new_width), new_width)
@@ -203,11 +197,10 @@ def play_video():
             # Apply matrix effect while paused
             matrix_effect(screen, ascii_image_lines, char_width, char_height)
             screen.fill((0, 0, 0))
-            for i, line in enumerate(ascii_image_lines):
-                for j, char in enumerate(line):
-                    color = COLORS.get(char, (255, 255, 255))
-                    text_surface = font.render(char, True, color)
-                    screen.blit(text_surface, (j * char_width, (i + 1) * char_height))
+            if tiler is not None:
+                tiler.draw(screen, ascii_image_lines, (0, char_height))
+            else:
+                draw_ascii(screen, font, ascii_image_lines, (0, char_height))
             
             pygame.display.flip()
 
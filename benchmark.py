@@ -0,0 +1,77 @@
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+import pygame
+
+from tiles import ASCII_CHARS, COLORS, TiledRenderer, to_ascii, render_ascii, draw_ascii
+
+def run_single(font, frames, screen, char_width, char_height):
+    # The single-threaded path play_video() takes when tiling is off
+    width = screen.get_width() // char_width
+    height = screen.get_height() // char_height - 2
+
+    start = time.perf_counter()
+    for frame in frames:
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        frame = cv2.resize(frame, (width, height))
+        lines = render_ascii(to_ascii(frame), width)
+        screen.fill((0, 0, 0))
+        draw_ascii(screen, font, lines, (0, char_height))
+    return (time.perf_counter() - start) / len(frames)
+
+def run_tiled(tiler, frames, screen, char_width, char_height):
+    width = screen.get_width() // char_width
+    height = screen.get_height() // char_height - 2
+
+    start = time.perf_counter()
+    for frame in frames:
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        frame = cv2.resize(frame, (width, height))
+        lines = tiler.convert(frame)
+        screen.fill((0, 0, 0))
+        tiler.draw(screen, lines, (0, char_height))
+    return (time.perf_counter() - start) / len(frames)
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure how tiled ASCII rendering scales with worker count.')
+    parser.add_argument('--size', type=int, nargs=2, default=(7680, 2160), help='screen size of the video wall')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='highest worker count to try')
+    parser.add_argument('--backend', choices=('process', 'thread'), default='process')
+    parser.add_argument('--frames', type=int, default=30)
+    args = parser.parse_args()
+
+    pygame.init()
+    font = pygame.font.SysFont('Courier', 12)
+    char_width, char_height = font.size('P')
+    screen = pygame.Surface(args.size)
+
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 256, (1080, 1920, 3), dtype=np.uint8) for _ in range(args.frames)]
+
+    print(f"{args.size[0]}x{args.size[1]}, {args.backend} backend, {args.frames} frames")
+    print(f"{'workers':>7} {'ms/frame':>9} {'vs single':>9} {'speedup':>8} {'efficiency':>10}")
+
+    single = run_single(font, frames, screen, char_width, char_height)
+    print(f"{'single':>7} {single * 1000:>9.1f} {1:>9.2f}")
+
+    # Speedup and efficiency are against the tiled renderer on one worker
+    baseline = None
+    for workers in range(1, args.workers + 1):
+        tiler = TiledRenderer('Courier', 12, ASCII_CHARS, COLORS, workers, args.backend)
+        run_tiled(tiler, frames[:1], screen, char_width, char_height)  # warm up the pools
+        seconds = run_tiled(tiler, frames, screen, char_width, char_height)
+        tiler.close()
+
+        baseline = baseline or seconds
+        speedup = baseline / seconds
+        print(f"{workers:>7} {seconds * 1000:>9.1f} {single / seconds:>9.2f} {speedup:>8.2f} {speedup / workers:>10.0%}")
+
+    pygame.quit()
+
+if __name__ == '__main__':
+    main()
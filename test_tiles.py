@@ -0,0 +1,61 @@
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pygame
+import pytest
+
+from tiles import ASCII_CHARS, COLORS, TiledRenderer, to_ascii, render_ascii, draw_ascii, split_bands
+
+@pytest.fixture(scope='module')
+def font():
+    pygame.init()
+    yield pygame.font.SysFont('Courier', 12)
+    pygame.quit()
+
+@pytest.mark.parametrize('height', [0, 1, 5, 17])
+@pytest.mark.parametrize('bands', [1, 2, 4, 30])
+def test_split_bands_covers_every_row(height, bands):
+    ranges = split_bands(height, bands)
+    rows = [row for top, bottom in ranges for row in range(top, bottom)]
+    assert rows == list(range(height))
+    assert len(ranges) <= bands
+
+@pytest.mark.parametrize('shape', [(0, 7), (1, 1), (17, 23), (40, 13)])
+@pytest.mark.parametrize('workers', [1, 2, 3, 7])
+def test_convert_matches_to_ascii(font, shape, workers):
+    image = np.random.default_rng(0).integers(0, 256, shape, dtype=np.uint8)
+    tiler = TiledRenderer('Courier', 12, ASCII_CHARS, COLORS, workers, 'thread')
+    try:
+        assert tiler.convert(image) == render_ascii(to_ascii(image), shape[1])
+    finally:
+        tiler.close()
+
+@pytest.mark.parametrize('workers', [1, 3])
+def test_convert_zero_width(font, workers):
+    image = np.zeros((5, 0), dtype=np.uint8)
+    tiler = TiledRenderer('Courier', 12, ASCII_CHARS, COLORS, workers, 'thread')
+    try:
+        assert tiler.convert(image) == [''] * 5
+    finally:
+        tiler.close()
+
+@pytest.mark.parametrize('backend', ['thread', 'process'])
+@pytest.mark.parametrize('workers', [1, 4])
+def test_draw_matches_draw_ascii(font, backend, workers):
+    char_width, char_height = font.size('P')
+    image = np.random.default_rng(1).integers(0, 256, (9, 11), dtype=np.uint8)
+    lines = render_ascii(to_ascii(image), 11)
+    size = (14 * char_width, 12 * char_height)
+
+    expected = pygame.Surface(size)
+    draw_ascii(expected, font, lines, (0, char_height))
+
+    tiler = TiledRenderer('Courier', 12, ASCII_CHARS, COLORS, workers, backend)
+    try:
+        screen = pygame.Surface(size)
+        tiler.draw(screen, lines, (0, char_height))
+    finally:
+        tiler.close()
+
+    assert pygame.image.tobytes(screen, 'RGB') == pygame.image.tobytes(expected, 'RGB')
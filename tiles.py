@@ -0,0 +1,243 @@
+import atexit
+import math
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import pygame
+
+ASCII_CHARS = "░@B%8&WM#*oahkbdpqwmZO0QLCJUYXzcvunxrjft/|()1{}[]?-_+~<>i!lI;:,^`'. "
+ASCII_CHARS = ASCII_CHARS[::-1]  # Invert for better visual result
+
+COLORS = {
+    '#': (245, 5, 183),
+}
+
+# Glyphs, cell positions and attached shared memory of a rasterizing worker process
+_worker = {}
+
+def to_ascii(image):
+    pixels = image.flatten()
+    num_chars = len(ASCII_CHARS)
+    scale = 256 // num_chars if num_chars else 1
+    ascii_str = "".join([ASCII_CHARS[min(pixel // scale, num_chars - 1)] for pixel in pixels])
+    return ascii_str
+
+def render_ascii(ascii_image, width):
+    return [ascii_image[i:i + width] for i in range(0, len(ascii_image), width)]
+
+def draw_ascii(screen, font, ascii_image_lines, origin):
+    char_width, char_height = font.size('P')
+    x, y = origin
+    for i, line in enumerate(ascii_image_lines):
+        for j, char in enumerate(line):
+            color = COLORS.get(char, (255, 255, 255))
+            text_surface = font.render(char, True, color)
+            screen.blit(text_surface, (x + j * char_width, y + i * char_height))
+
+def split_bands(height, bands):
+    if height <= 0:
+        return []
+    bands = max(1, min(bands, height))
+    step = -(-height // bands)
+    return [(top, min(top + step, height)) for top in range(0, height, step)]
+
+def build_lut(ascii_chars):
+    # Same mapping as to_ascii(), precomputed for every possible pixel value
+    num_chars = len(ascii_chars)
+    scale = 256 // num_chars if num_chars else 1
+    return np.array([ascii_chars[min(pixel // scale, num_chars - 1)] for pixel in range(256)])
+
+def band_to_lines(pixels, lut):
+    chars = lut[pixels]
+    if chars.shape[1] == 0:
+        return [''] * chars.shape[0]
+    # View each row of single chars as one fixed-width string, so the whole band is joined inside NumPy
+    return chars.view('<U%d' % chars.shape[1]).ravel().tolist()
+
+def build_glyphs(font, ascii_chars, colors):
+    glyphs = {}
+    for char in set(ascii_chars):
+        glyphs[char] = font.render(char, True, colors.get(char, (255, 255, 255)))
+    # Spaces and unknown chars are drawn as an empty surface, so no cell needs a Python check
+    glyphs[' '] = pygame.Surface((0, 0))
+    return glyphs
+
+def cell_positions(rows, width, skip, char_width, char_height):
+    # Top-left corner of every cell, the first skip rows are context drawn above the surface
+    return [(j * char_width, (i - skip) * char_height) for i in range(rows) for j in range(width)]
+
+def draw_band(surface, glyphs, lines, positions):
+    surface.fill((0, 0, 0))
+    cells = map(glyphs.get, ''.join(lines), repeat(glyphs[' ']))
+    surface.blits(zip(cells, positions), doreturn=False)
+
+def _init_worker(font_name, font_size, ascii_chars, colors):
+    pygame.font.init()
+    font = pygame.font.SysFont(font_name, font_size)
+    _worker['glyphs'] = build_glyphs(font, ascii_chars, colors)
+    _worker['cell'] = font.size('P')
+    _worker['positions'] = {}
+    _worker['shm'] = None
+
+def _rasterize_shared_band(shm_name, offset, size, depth, masks, lines, skip):
+    shm = _worker['shm']
+    if shm is None or shm.name != shm_name:
+        # Keep only the current block attached, older ones were unlinked on resize
+        if shm is not None:
+            shm.close()
+        shm = shared_memory.SharedMemory(name=shm_name)
+        _worker['shm'] = shm
+
+    key = (len(lines), len(lines[0]), skip)
+    positions = _worker['positions'].get(key)
+    if positions is None:
+        positions = cell_positions(*key, *_worker['cell'])
+        _worker['positions'][key] = positions
+
+    # Draw in the screen's pixel format so blending rounds exactly like draw_ascii(),
+    # then copy the opaque result into shared memory
+    surface = pygame.Surface(size, 0, depth, masks)
+    draw_band(surface, _worker['glyphs'], lines, positions)
+    view = shm.buf[offset:offset + size[0] * size[1] * 4]
+    band = pygame.image.frombuffer(view, size, 'RGBX')
+    band.blit(surface, (0, 0))
+    del band
+    view.release()
+
+class TiledRenderer:
+    """Converts and draws the ASCII grid in horizontal bands on worker pools.
+
+    The conversion runs on threads, since cv2 and NumPy do it without holding the GIL.
+    Drawing the glyphs is Python and pygame work that holds the GIL, so with the
+    'process' backend each band is drawn by a forked worker and copied into a shared
+    memory pixel buffer, and only the finished bands are blitted here. The 'thread' backend
+    draws on threads instead, which works everywhere but doesn't scale.
+
+    Each band is padded by the glyph overhang and also draws the rows above it whose
+    glyphs reach into it, so the result matches draw_ascii() pixel for pixel.
+    """
+
+    def __init__(self, font_name, font_size, ascii_chars, colors, workers, backend='process'):
+        self.workers = workers
+        self.lut = build_lut(ascii_chars)
+        font = pygame.font.SysFont(font_name, font_size)
+        self.char_width, self.char_height = font.size('P')
+        self.glyphs = build_glyphs(font, ascii_chars, colors)
+
+        # Glyphs are drawn from the cell's top-left corner, so they can only overhang right and down
+        self.pad_x = max(max(glyph.get_width() for glyph in self.glyphs.values()) - self.char_width, 0)
+        self.pad_y = max(max(glyph.get_height() for glyph in self.glyphs.values()) - self.char_height, 0)
+        self.pad_rows = math.ceil(self.pad_y / self.char_height)
+
+        self.layouts = {}
+        self.positions = {}
+        self.processes = None
+        self.shm = None
+
+        if backend == 'process':
+            # Spawned workers would re-run the player script on import, so only fork is usable
+            if 'fork' in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context('fork')
+                # Share one resource tracker with the workers, or each would start its own
+                # and report the blocks they attach as leaked when it exits
+                resource_tracker.ensure_running()
+                self.processes = ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker,
+                                                     initargs=(font_name, font_size, ascii_chars, colors))
+                # Fork every worker now, before any thread pool or audio threads exist
+                self.processes.submit(int).result()
+            else:
+                print("Process tiling needs fork, falling back to threads...")
+        elif backend != 'thread':
+            print(f"Unknown tile backend '{backend}', falling back to threads...")
+
+        self.threads = ThreadPoolExecutor(max_workers=workers)
+        atexit.register(self.close)
+
+    def convert(self, image):
+        bands = split_bands(image.shape[0], self.workers)
+        jobs = [self.threads.submit(band_to_lines, image[top:bottom], self.lut) for top, bottom in bands]
+
+        lines = []
+        for job in jobs:
+            lines.extend(job.result())
+        return lines
+
+    def draw(self, screen, lines, origin):
+        if not lines or not lines[0]:
+            return
+        layout = self._layout(len(lines), len(lines[0]))
+        if self.processes is not None:
+            self._draw_processes(screen, lines, origin, layout)
+        else:
+            self._draw_threads(screen, lines, origin, layout)
+
+    def _layout(self, rows, width):
+        # Rows drawn by each band, with its context rows, surface size and offset in shared memory
+        key = (rows, width)
+        if key not in self.layouts:
+            layout = []
+            offset = 0
+            for top, bottom in split_bands(rows, self.workers):
+                context = max(top - self.pad_rows, 0)
+                height = (bottom - top) * self.char_height + (self.pad_y if bottom == rows else 0)
+                size = (width * self.char_width + self.pad_x, height)
+                layout.append((top, bottom, context, size, offset))
+                offset += size[0] * size[1] * 4
+            self.layouts[key] = (layout, offset)
+        return self.layouts[key]
+
+    def _draw_threads(self, screen, lines, origin, layout):
+        bands, _ = layout
+        jobs = [self.threads.submit(self._rasterize_band, screen, lines[context:bottom], top - context, size)
+                for top, bottom, context, size, _ in bands]
+
+        # Composite the finished bands, one blit each
+        x, y = origin
+        for (top, *_), job in zip(bands, jobs):
+            screen.blit(job.result(), (x, y + top * self.char_height))
+
+    def _rasterize_band(self, screen, lines, skip, size):
+        key = (len(lines), len(lines[0]), skip)
+        if key not in self.positions:
+            self.positions[key] = cell_positions(*key, self.char_width, self.char_height)
+        surface = pygame.Surface(size, 0, screen)
+        draw_band(surface, self.glyphs, lines, self.positions[key])
+        return surface
+
+    def _draw_processes(self, screen, lines, origin, layout):
+        bands, nbytes = layout
+        if self.shm is None or self.shm.size < nbytes:
+            self._release_shm()
+            self.shm = shared_memory.SharedMemory(create=True, size=nbytes)
+
+        depth, masks = screen.get_bitsize(), screen.get_masks()
+        jobs = [self.processes.submit(_rasterize_shared_band, self.shm.name, offset, size, depth, masks,
+                                      lines[context:bottom], top - context)
+                for top, bottom, context, size, offset in bands]
+
+        # Composite the finished bands straight from shared memory, one blit each
+        x, y = origin
+        for (top, bottom, context, size, offset), job in zip(bands, jobs):
+            job.result()
+            view = self.shm.buf[offset:offset + size[0] * size[1] * 4]
+            band = pygame.image.frombuffer(view, size, 'RGBX')
+            screen.blit(band, (x, y + top * self.char_height))
+            del band
+            view.release()
+
+    def _release_shm(self):
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+    def close(self):
+        atexit.unregister(self.close)
+        self.threads.shutdown(wait=False)
+        if self.processes is not None:
+            self.processes.shutdown(wait=True)
+            self.processes = None
+        self._release_shm()